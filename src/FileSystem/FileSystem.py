@@ -1,10 +1,123 @@
-from typing import Any, Union, List, Tuple
+from typing import Any, Union, List, Tuple, Dict
+from concurrent.futures import ThreadPoolExecutor
 from cryptography.fernet import Fernet
+import threading
 import shutil
+import math
 import uuid
 import json
 import os
 
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson  # Optional: SIMD JSON parser for large files
+except ImportError:
+    simdjson = None
+
+# simdjson parsers reuse their internal buffer and are not thread-safe, keep one per thread
+_simdjson_local = threading.local()
+
+# Extensions always read in binary mode
+_BINARY_EXTS = frozenset({
+    ".png", ".jpg", ".jpeg", ".bmp", ".gif",
+    ".mp3", ".wav", ".ogg", ".flac",
+    ".pdf", ".csv", ".zip", ".bin"
+})
+
+# Buffer size used when reading files (the 8KB default is too small for whole-file reads)
+READ_BUFFER = 1 << 20
+
+# Below this size the simdjson call overhead outweighs its parsing speed
+SIMDJSON_MIN_SIZE = 64 * 1024
+
+# Binary payloads above this size are written with os.write, in chunks of this size
+WRITE_CHUNK = 1 << 20
+
+# Worker cap for batch operations (file I/O releases the GIL)
+MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _has_non_finite(content: Any) -> bool:
+    """Return True if content holds a NaN or infinite float anywhere."""
+    if isinstance(content, float):
+        return not math.isfinite(content)
+    if isinstance(content, dict):
+        return any(_has_non_finite(value) for value in content.values())
+    if isinstance(content, (list, tuple)):
+        return any(_has_non_finite(value) for value in content)
+    return False
+
+
+def _orjson_reject(obj: Any) -> Any:
+    """orjson `default` hook: refuse types that stdlib json can't encode either."""
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(content: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize content to UTF-8 JSON bytes (compact unless pretty), using orjson when available.
+
+    orjson is limited to what stdlib json accepts: datetimes and dataclasses are
+    rejected, and non-str dict keys are left to stdlib json. UUID and Enum values
+    are the exception, orjson encodes them natively (as string / value) while
+    stdlib json, and so pretty=True, raises for them.
+    """
+    # Pretty output always comes from stdlib json so the 4-space layout doesn't depend on orjson
+    if pretty:
+        return json.dumps(content, indent=4, ensure_ascii=False).encode("utf-8")
+    if orjson is not None:
+        try:
+            data = orjson.dumps(
+                content,
+                default=_orjson_reject,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+            # orjson writes NaN/Infinity as null, only then is the content walked to check
+            if b"null" not in data or not _has_non_finite(content):
+                return data
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits or non-str keys (including NaN keys), stdlib json handles those
+            pass
+    return json.dumps(content, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _write_large(path: str, data: bytes, prefix: bytes = b"") -> None:
+    """Write bytes straight to a file descriptor, skipping the BufferedWriter copy."""
+    # 0o666 so the umask applies exactly as it does for open(path, "wb")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        for chunk in (prefix, data):
+            view = memoryview(chunk)
+            while view:
+                written = os.write(fd, view[:WRITE_CHUNK])
+                view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize JSON from bytes, using simdjson for large payloads or orjson when available."""
+    if simdjson is not None and len(data) > SIMDJSON_MIN_SIZE:
+        parser = getattr(_simdjson_local, "parser", None)
+        if parser is None:
+            parser = _simdjson_local.parser = simdjson.Parser()
+        try:
+            return parser.parse(data, recursive=True)
+        except (ValueError, RuntimeError):
+            # simdjson rejects NaN/Infinity and integers wider than 64 bits
+            pass
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity and integers wider than 64 bits are only accepted by stdlib json
+            pass
+    return json.loads(data)
+
 
 class FileSystem:
     """
@@ -36,21 +149,43 @@ class FileSystem:
 
         if existing_keys:
             # Use the first key found
+            # (raw descriptor for a 44-byte file, symlinks are rejected where supported)
             key_path = os.path.join(self.storage_temp, existing_keys[0])
-            with open(key_path, "rb") as key_file:
-                self.key = key_file.read()
+            fd = os.open(key_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_BINARY", 0))
+            try:
+                self.key = os.read(fd, 128)
+            finally:
+                os.close(fd)
         else:
-            # Generate a new key and save it
+            # Generate a new key and save it (readable by the owner only)
             key_file_name = f"{uuid.uuid4()}.key"
             key_path = os.path.join(self.storage_temp, key_file_name)
             self.key = Fernet.generate_key()
-            with open(key_path, "wb") as key_file:
-                key_file.write(self.key)
+            fd = os.open(
+                key_path,
+                os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+                0o600
+            )
+            try:
+                os.write(fd, self.key)
+            finally:
+                os.close(fd)
 
         self.cipher = Fernet(self.key)
 
+        # Precomputed prefixes so plain file names can skip os.path.join
+        self._data_prefix = os.path.join(self.storage_data, "")
+        self._temp_prefix = os.path.join(self.storage_temp, "")
+
     def _get_path(self, file_name: str, temp: bool = False) -> str:
         """Return the full path of a file in data or temp storage."""
+        if (
+            os.sep not in file_name
+            and (os.altsep is None or os.altsep not in file_name)
+            and ":" not in file_name  # Windows drive-relative names
+            and ".." not in file_name
+        ):
+            return (self._temp_prefix if temp else self._data_prefix) + file_name
         base_path = self.storage_temp if temp else self.storage_data
         return os.path.join(base_path, file_name)
 
@@ -60,7 +195,8 @@ class FileSystem:
         file_content: Any,
         temp: bool = False,
         overwrite: bool = False,
-        encrypt: bool = False
+        encrypt: bool = False,
+        pretty: bool = False
     ) -> Union[str, bool]:
         """
         Save file content to storage, supporting text, JSON, and binary files (images, audio, CSV, etc.).
@@ -73,48 +209,65 @@ class FileSystem:
             * bytes → binary file
         - temp: Save in temporary storage if True.
         - overwrite: Allow overwriting existing files.
-        - encrypt: Encrypt contents using Fernet (works for text and bytes).
+        - encrypt: Encrypt contents using Fernet (works for text, JSON and bytes).
+        - pretty: Indent JSON output for human reading (compact by default).
 
         Returns:
         - True if successful.
         - Error message (str) if failed.
         """
         try:
-            base_dir = self.storage_temp if temp else self.storage_data
-            full_path = os.path.join(base_dir, file_name)
-            dir_path = os.path.dirname(full_path)
+            full_path = self._get_path(file_name, temp)
 
-            # Create intermediate directories if needed
-            if dir_path and not os.path.exists(dir_path):
-                os.makedirs(dir_path, exist_ok=True)
+            # Create intermediate directories if needed (the base directory always exists)
+            if os.path.dirname(file_name):
+                dir_path = os.path.dirname(full_path)
+                if not os.path.isdir(dir_path):
+                    os.makedirs(dir_path, exist_ok=True)
 
             # Check overwrite
-            if os.path.exists(full_path) and not overwrite:
-                return "File already exists."
+            if not overwrite:
+                try:
+                    os.stat(full_path)
+                    return "File already exists."
+                except FileNotFoundError:
+                    pass
 
             # Determine if file is binary
             is_binary = isinstance(file_content, bytes)
 
+            # Marker written before the content (kept separate to avoid copying the payload)
+            prefix = b""
+
             # Encrypt if requested
             if encrypt:
-                if not is_binary:
-                    file_content = str(file_content).encode("utf-8")
-                encrypted_data = self.cipher.encrypt(file_content)
-                file_content = b"E::" + encrypted_data
+                if is_binary:
+                    payload = file_content
+                elif isinstance(file_content, (dict, list)) or file_name.endswith(".json"):
+                    payload = _json_dumps(file_content, pretty)
+                else:
+                    payload = str(file_content).encode("utf-8")
+                file_content = self.cipher.encrypt(payload)
+                prefix = b"E::"
                 is_binary = True  # Encrypted files are always binary
 
+            # JSON is encoded straight to bytes
+            if not is_binary and (isinstance(file_content, (dict, list)) or file_name.endswith(".json")):
+                file_content = _json_dumps(file_content, pretty)
+                is_binary = True
+
             # Write file
             if is_binary:
-                with open(full_path, "wb") as f:
-                    f.write(file_content)
-            else:
-                # JSON or text
-                if isinstance(file_content, (dict, list)) or file_name.endswith(".json"):
-                    file_content = json.dumps(file_content, indent=4, ensure_ascii=False)
+                if len(file_content) > WRITE_CHUNK:
+                    _write_large(full_path, file_content, prefix)
                 else:
-                    file_content = str(file_content)
+                    with open(full_path, "wb") as f:
+                        if prefix:
+                            f.write(prefix)
+                        f.write(file_content)
+            else:
                 with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(file_content)
+                    f.write(str(file_content))
 
             return True
 
@@ -138,54 +291,103 @@ class FileSystem:
         """
         file_path = self._get_path(file_name, temp)
 
-        if not os.path.exists(file_path):
-            return "File not found"
-
         try:
-            # Determine if binary mode is needed
-            is_binary = False
-            if file_name.lower().endswith((
-                ".png", ".jpg", ".jpeg", ".bmp", ".gif",
-                ".mp3", ".wav", ".ogg", ".flac",
-                ".pdf", ".csv", ".zip", ".bin"
-            )):
-                is_binary = True
-
-            # Open file
+            is_json = file_name.endswith(".json")
+
+            # Determine if binary mode is needed (rpartition, unlike splitext, also matches names like '.png')
+            _, dot, ext = file_name.rpartition(".")
+            is_binary = bool(dot) and "." + ext.lower() in _BINARY_EXTS
+
+            # JSON files are read as bytes, the decoder handles UTF-8 itself
+            if is_json:
+                # Unbuffered, readall() sizes its buffer from fstat
+                with open(file_path, "rb", buffering=0) as f:
+                    encrypted = f.read(3) == b"E::"
+                    if not encrypted:
+                        f.seek(0)
+                    data = f.readall()
+                if encrypted:
+                    decrypted = self.cipher.decrypt(data)
+                    try:
+                        return _json_loads(decrypted)
+                    except ValueError:
+                        # Encrypted before JSON was encoded on save (repr text), return it as is.
+                        # Older encrypted strings that happen to be valid JSON (e.g. "42") are parsed.
+                        return decrypted.decode("utf-8")
+                return _json_loads(data)
+
+            # Binary files: peek the 'E::' marker before reading the payload
             if is_binary:
-                with open(file_path, "rb") as f:
-                    data = f.read()
-            else:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = f.read()
+                # Unbuffered, readall() sizes its buffer from fstat
+                with open(file_path, "rb", buffering=0) as f:
+                    encrypted = f.read(3) == b"E::"
+                    if encrypted:
+                        return self.cipher.decrypt(f.readall())
+                    f.seek(0)
+                    return f.readall()
+
+            with open(file_path, "r", encoding="utf-8", buffering=READ_BUFFER) as f:
+                data = f.read()
 
             # Decrypt if encrypted
-            if isinstance(data, bytes):
-                if data.startswith(b"E::"):
-                    decrypted = self.cipher.decrypt(data[3:])
-                    return decrypted
-                else:
-                    return data
-            else:
-                if data.startswith("E::"):
-                    decrypted = self.cipher.decrypt(data[3:].encode("utf-8"))
-                    return decrypted.decode("utf-8")
-                if file_name.endswith(".json"):
-                    return json.loads(data)
-                return data
+            if data.startswith("E::"):
+                decrypted = self.cipher.decrypt(data[3:].encode("utf-8"))
+                return decrypted.decode("utf-8")
+            return data
 
+        except FileNotFoundError:
+            return "File not found"
         except Exception as e:
             return f"Error reading file: {e}"
 
+    def save_files(self, items: List[Tuple[str, Any]], **kwargs) -> Dict[str, Union[str, bool]]:
+        """
+        Save several files concurrently.
+
+        Parameters:
+        - items: List of (file_name, file_content) pairs.
+        - kwargs: Options passed to save_file() for every item (temp, overwrite, encrypt, pretty).
+
+        Returns:
+        - Dict mapping each file name to the result of save_file().
+        """
+        if not items:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(items))) as executor:
+            futures = [
+                (name, executor.submit(self.save_file, name, content, **kwargs))
+                for name, content in items
+            ]
+            return {name: future.result() for name, future in futures}
+
+    def read_files(self, file_names: List[str], temp: bool = False) -> Dict[str, Union[str, dict, bytes]]:
+        """
+        Read several files concurrently.
+
+        Parameters:
+        - file_names: List of file names (and optionally paths) to read.
+        - temp: Read from temporary storage if True.
+
+        Returns:
+        - Dict mapping each file name to the result of read_file().
+        """
+        if not file_names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(file_names))) as executor:
+            futures = [
+                (name, executor.submit(self.read_file, name, temp))
+                for name in file_names
+            ]
+            return {name: future.result() for name, future in futures}
+
     def delete_file(self, file_name: str, temp: bool = False) -> str:
         """Delete a file from storage."""
         file_path = self._get_path(file_name, temp)
-        if not os.path.exists(file_path):
-            return "File not found"
-
         try:
             os.remove(file_path)
             return f"Deleted {file_path}"
+        except FileNotFoundError:
+            return "File not found"
         except Exception as e:
             return f"Error deleting file: {e}"
 
@@ -207,12 +409,15 @@ class FileSystem:
         - List of file names, tuple, or formatted string.
         """
         try:
-            data_storage_content = [f for f in os.listdir(self.storage_data)]
-            temp_storage_content = [f for f in os.listdir(self.storage_temp) if not f.endswith(".key")]
-
             if not list_both_directories:
                 base_path = self.storage_temp if temp else self.storage_data
-                return [f for f in os.listdir(base_path) if not f.endswith(".key")]
+                with os.scandir(base_path) as entries:
+                    return [e.name for e in entries if not e.name.endswith(".key")]
+
+            with os.scandir(self.storage_data) as entries:
+                data_storage_content = [e.name for e in entries]
+            with os.scandir(self.storage_temp) as entries:
+                temp_storage_content = [e.name for e in entries if not e.name.endswith(".key")]
 
             if show_details:
                 return (
@@ -227,21 +432,35 @@ class FileSystem:
 
     def file_exists(self, file_name: str, temp: bool = False) -> bool:
         """Check if a file exists in storage."""
-        return os.path.exists(self._get_path(file_name, temp))
+        try:
+            os.stat(self._get_path(file_name, temp))
+            return True
+        except OSError:
+            return False
 
-    def edit_file(self, file_name: str, new_content: Any, temp: bool = False, encrypt: bool = False) -> str:
+    def edit_file(
+        self,
+        file_name: str,
+        new_content: Any,
+        temp: bool = False,
+        encrypt: bool = False,
+        pretty: bool = False
+    ) -> str:
         """Overwrite the content of an existing file."""
         if not self.file_exists(file_name, temp):
             return "File not found"
-        return self.save_file(file_name, new_content, temp=temp, overwrite=True, encrypt=encrypt)
+        return self.save_file(file_name, new_content, temp=temp, overwrite=True, encrypt=encrypt, pretty=pretty)
 
     def clear_storage(self, temp: bool = False) -> str:
         """Delete all files in the selected storage directory (except keys)."""
         base_path = self.storage_temp if temp else self.storage_data
         try:
-            for file in os.listdir(base_path):
-                if not file.endswith(".key"):
-                    os.remove(os.path.join(base_path, file))
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    # Folders are left alone, use delete_folder() for those
+                    if entry.is_dir(follow_symlinks=False) or entry.name.endswith(".key"):
+                        continue
+                    os.unlink(entry.path)
             return f"Cleared storage: {base_path}"
         except Exception as e:
             return f"Error clearing storage: {e}"
@@ -275,7 +494,8 @@ class FileSystem:
         self, 
         file_names: list[str],
         temp: bool = False, 
-        search_in_any_folders: bool = False
+        search_in_any_folders: bool = False,
+        first_match_only: bool = False
     ) -> dict:
         """
         Search for multiple files by name in storage.
@@ -284,6 +504,7 @@ class FileSystem:
         - file_names: List of file names (or partial names) to search for.
         - temp: Search in temporary storage if True.
         - search_in_any_folders: Search recursively in subfolders if True.
+        - first_match_only: Stop looking for a name after its first match.
 
         Returns:
         - Dict mapping each file name to a list of full paths or "File Not Found".
@@ -294,22 +515,42 @@ class FileSystem:
         base_path = self.storage_temp if temp else self.storage_data
         results = {name: [] for name in file_names}
 
+        # Lowercase each search term once instead of on every comparison
+        needles = [(name, name.lower()) for name in file_names]
+
         if not search_in_any_folders:
-            files = os.listdir(base_path)
-            for f in files:
-                for name in file_names:
-                    if name.lower() in f.lower():
-                        results[name].append(os.path.join(base_path, f))
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    if not needles:
+                        break
+                    # Only match files, like the recursive search (is_file() is cached by scandir)
+                    if not entry.is_file():
+                        continue
+                    lowered = entry.name.lower()
+                    matched = False
+                    for name, needle in needles:
+                        if needle in lowered:
+                            results[name].append(entry.path)
+                            matched = True
+                    if matched and first_match_only:
+                        needles = [(name, needle) for name, needle in needles if not results[name]]
         else:
             for root, _, files in os.walk(base_path):
+                if not needles:
+                    break
+                # Join once per folder, then build file paths by concatenation
+                root_prefix = os.path.join(root, "")
                 for f in files:
-                    for name in file_names:
-                        if name.lower() in f.lower():
-                            results[name].append(os.path.join(root, f))
-
-        # Replace empty lists with "File Not Found"
-        for name in results:
-            if not results[name]:
-                results[name] = "File Not Found"
-
-        return results
+                    lowered = f.lower()
+                    matched = False
+                    for name, needle in needles:
+                        if needle in lowered:
+                            results[name].append(root_prefix + f)
+                            matched = True
+                    if matched and first_match_only:
+                        needles = [(name, needle) for name, needle in needles if not results[name]]
+                        if not needles:
+                            break
+
+        # Empty lists become "File Not Found"
+        return {name: paths if paths else "File Not Found" for name, paths in results.items()}
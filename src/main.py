@@ -14,22 +14,25 @@ def main(page: Page):
     storage = FileSystem()
 
     # -----------------------------
-    # 1️⃣ Save a text file
+    # 1️⃣ Text file
     text_file_name = "hello.txt"
-    storage.save_file(text_file_name, "Hello, Flet FileSystem!", overwrite=True)
+    files_to_save = [(text_file_name, "Hello, Flet FileSystem!")]
 
-    # 2️⃣ Save a JSON file
+    # 2️⃣ JSON file
     json_file_name = "data.json"
     json_content = {"name": "Flet", "type": "Framework", "version": 0.28}
-    storage.save_file(json_file_name, json_content, overwrite=True)
+    files_to_save.append((json_file_name, json_content))
 
-    # 3️⃣ Save an image file (binary)
+    # 3️⃣ Image file (binary)
     image_file_name = "sample_image.png"
     # Ensure the image exists in the same folder as this script
     if os.path.exists("sample_image.png"):
         with open("sample_image.png", "rb") as img:
             image_bytes = img.read()
-        storage.save_file(image_file_name, image_bytes, overwrite=True)
+        files_to_save.append((image_file_name, image_bytes))
+
+    # Save all files at once
+    storage.save_files(files_to_save, overwrite=True)
 
     # -----------------------------
     # 4️⃣ List files